@@ -1,12 +1,14 @@
 import os
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify, render_template, redirect, url_for, session, flash
+from flask import Flask, request, jsonify, render_template, redirect, url_for, session, flash, Response, stream_with_context
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
-from models import db, ProductModel, UserModel, ProductCreate, UserCreate, UserLogin, CartItem, CheckoutRequest
+from models import db, ProductModel, ProductChangeModel, UserModel, ProductCreate, UserCreate, UserLogin, CartItem, CheckoutRequest
+from assets import init_assets
 from datetime import datetime, timedelta
 import uuid
+import time
 import base64
 import json
 
@@ -22,13 +24,22 @@ app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(basedir, 'inst
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload
+app.config['CHANGES_PAGE_SIZE'] = 100 # Default batch for /api/items/changes
+app.config['CHANGES_MAX_PAGE_SIZE'] = 1000
+app.config['CHANGES_STREAM_POLL_SECONDS'] = 2
+app.config['CHANGES_STREAM_MAX_SECONDS'] = 20 # Well under gunicorn's 30s worker timeout; clients reconnect
 
 db.init_app(app)
 jwt = JWTManager(app)
+init_assets(app) # Fingerprinted static bundles (see build_assets.py)
 
 # Create Database tables
 with app.app_context():
     db.create_all()
+    # Databases created before updated_at existed need the column added
+    if 'updated_at' not in [c['name'] for c in db.inspect(db.engine).get_columns('products')]:
+        with db.engine.begin() as conn:
+            conn.execute(db.text('ALTER TABLE products ADD COLUMN updated_at DATETIME'))
     # Seed initial products if empty
     if not ProductModel.query.first():
         sample_products = [
@@ -38,6 +49,10 @@ with app.app_context():
         ]
         db.session.bulk_save_objects(sample_products)
         db.session.commit()
+    # Start the change log from the current catalog so mirrors can sync from seq 0
+    if not ProductChangeModel.query.first():
+        db.session.add_all([ProductChangeModel(product_id=p.id, op='create') for p in ProductModel.query.all()])
+        db.session.commit()
 
 # Helper: Convert Image to Base64
 def get_image_base64(file):
@@ -48,6 +63,54 @@ def get_image_base64(file):
         return f"data:{file.content_type};base64,{encoded_string}"
     return None
 
+# Helper: Serialize a product for the REST API
+def product_to_dict(p):
+    return {
+        "id": p.id,
+        "name": p.name,
+        "description": p.description,
+        "price": p.price,
+        "category": p.category,
+        "image_base64": p.image_base64,
+        "created_at": p.created_at.isoformat(),
+        "updated_at": p.updated_at.isoformat() if p.updated_at else None
+    }
+
+# Helper: Append to the change log in the caller's transaction (committed with the product change)
+def log_product_change(product, op):
+    if product.id is None:
+        db.session.flush() # New products need their id first
+    db.session.add(ProductChangeModel(product_id=product.id, op=op))
+
+# Helper: Serialize a change, with the current product state for create/update
+def change_to_dict(change, product):
+    return {
+        "seq": change.seq,
+        "op": change.op,
+        "product_id": change.product_id,
+        "changed_at": change.changed_at.isoformat(),
+        "item": product_to_dict(product) if product and change.op != 'delete' else None
+    }
+
+# Helper: Fetch up to `limit` changes after `since`, hydrated with their products
+def get_changes(since, limit):
+    changes = ProductChangeModel.query.filter(ProductChangeModel.seq > since).order_by(ProductChangeModel.seq).limit(limit).all()
+    product_ids = {c.product_id for c in changes if c.op != 'delete'}
+    if not product_ids:
+        return [change_to_dict(c, None) for c in changes]
+    products = {p.id: p for p in ProductModel.query.filter(ProductModel.id.in_(product_ids))}
+    # A change followed by a delete of the same id describes a product that is gone,
+    # even if the id has since been reused (older databases lack AUTOINCREMENT)
+    last_deletes = dict(
+        db.session.query(ProductChangeModel.product_id, db.func.max(ProductChangeModel.seq))
+        .filter(ProductChangeModel.op == 'delete', ProductChangeModel.product_id.in_(product_ids))
+        .group_by(ProductChangeModel.product_id)
+    )
+    return [
+        change_to_dict(c, None if c.seq < last_deletes.get(c.product_id, 0) else products.get(c.product_id))
+        for c in changes
+    ]
+
 @app.route('/health')
 def health():
     return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()}), 200
@@ -101,20 +164,55 @@ def get_items():
         )
         
     products_list = query.all()
-    result = []
-    for p in products_list:
-        result.append({
-            "id": p.id,
-            "name": p.name,
-            "description": p.description,
-            "price": p.price,
-            "category": p.category,
-            "image_base64": p.image_base64,
-            "created_at": p.created_at.isoformat()
-        })
+    result = [product_to_dict(p) for p in products_list]
     
     return jsonify(result)
 
+@app.route('/api/items/changes', methods=['GET'])
+def get_item_changes():
+    since = request.args.get('since', 0, type=int)
+    limit = request.args.get('limit', app.config['CHANGES_PAGE_SIZE'], type=int)
+    limit = max(1, min(limit, app.config['CHANGES_MAX_PAGE_SIZE']))
+
+    # Fetch one extra row to know whether another batch is waiting
+    changes = get_changes(since, limit + 1)
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    return jsonify({
+        "changes": changes,
+        "last_seq": changes[-1]['seq'] if changes else since,
+        "has_more": has_more
+    })
+
+@app.route('/api/items/changes/stream', methods=['GET'])
+def stream_item_changes():
+    # Server-Sent Events; each stream ends after CHANGES_STREAM_MAX_SECONDS so it
+    # never pins a worker, and the client reconnects from Last-Event-ID
+    since = request.headers.get('Last-Event-ID', type=int)
+    if since is None:
+        since = request.args.get('since', 0, type=int)
+    poll_seconds = app.config['CHANGES_STREAM_POLL_SECONDS']
+    batch_size = app.config['CHANGES_MAX_PAGE_SIZE']
+    deadline = time.monotonic() + app.config['CHANGES_STREAM_MAX_SECONDS']
+
+    def generate(since):
+        yield f"retry: {poll_seconds * 1000}\n\n" # Reconnect delay once the stream ends
+        while True:
+            changes = get_changes(since, batch_size)
+            db.session.rollback() # End the read so the next poll sees new commits
+            for change in changes:
+                since = change['seq']
+                yield f"id: {since}\nevent: change\ndata: {json.dumps(change)}\n\n"
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if len(changes) < batch_size:
+                yield ": keep-alive\n\n"
+                time.sleep(min(poll_seconds, remaining))
+
+    return Response(stream_with_context(generate(since)), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/api/items', methods=['POST'])
 @jwt_required()
 def add_item():
@@ -128,6 +226,7 @@ def add_item():
             image_base64=data.image_base64
         )
         db.session.add(new_product)
+        log_product_change(new_product, 'create')
         db.session.commit()
         
         return jsonify({
@@ -165,6 +264,7 @@ def update_item_api(item_id):
             if file and file.filename != '':
                 product.image_base64 = get_image_base64(file)
         
+        log_product_change(product, 'update')
         db.session.commit()
 
         return jsonify({"message": "Product updated successfully"})
@@ -178,6 +278,7 @@ def delete_item(item_id):
     if not product:
         return jsonify({"error": "Item not found"}), 404
     
+    log_product_change(product, 'delete')
     db.session.delete(product)
     db.session.commit()
 
@@ -317,6 +418,7 @@ def edit_page(p_id):
         if file and file.filename != '':
             product.image_base64 = get_image_base64(file)
         
+        log_product_change(product, 'update')
         db.session.commit()
         flash("Product updated successfully!")
         return redirect(url_for('product_detail', p_id=product.id))
@@ -342,6 +444,7 @@ def upload_page():
             image_base64=image_base64
         )
         db.session.add(new_product)
+        log_product_change(new_product, 'create')
         db.session.commit()
         
         flash("Product uploaded successfully!")
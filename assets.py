@@ -0,0 +1,47 @@
+import json
+import os
+from flask import current_app, request, url_for
+
+# Fingerprinted files never change under the same name, so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def load_manifest(app):
+    # Written by build_assets.py: {"dist/app.css": "dist/app.<hash>.css", ...}
+    path = os.path.join(app.static_folder, 'dist', 'manifest.json')
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        app.logger.warning(
+            "%s not found; serving unbundled assets from static/src/. "
+            "Run 'npm install && npm run build' for production bundles.", path
+        )
+        return {}
+
+def asset_url_for(endpoint, **values):
+    """Same signature as url_for, but static filenames resolve to their hashed build output."""
+    if endpoint == 'static' and 'filename' in values:
+        manifest = current_app.extensions.get('asset_manifest', {})
+        filename = values['filename']
+        if filename in manifest:
+            values['filename'] = manifest[filename]
+        elif not manifest and filename.startswith('dist/'):
+            # Not built: the sources under static/src/ are usable as-is in development
+            values['filename'] = 'src/' + filename[len('dist/'):]
+    return url_for(endpoint, **values)
+
+def add_cache_headers(response):
+    if request.endpoint == 'static' and response.status_code in (200, 304):
+        filename = (request.view_args or {}).get('filename')
+        if filename in current_app.extensions.get('asset_manifest', {}).values():
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+def inject_assets_built():
+    return {'assets_built': bool(current_app.extensions.get('asset_manifest'))}
+
+def init_assets(app):
+    app.extensions['asset_manifest'] = load_manifest(app)
+    app.jinja_env.globals['asset_url_for'] = asset_url_for
+    app.context_processor(inject_assets_built)
+    app.after_request(add_cache_headers)
@@ -0,0 +1,73 @@
+"""Build the self-hosted static assets into static/dist/.
+
+Compiles the Tailwind CSS (purged against templates/ and static/src/),
+minifies the shared JS, copies the Outfit webfonts and gives every file a
+content-hashed name. The mapping is written to static/dist/manifest.json and
+read by assets.asset_url_for at runtime.
+
+Usage: npm install && npm run build
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+STATIC_DIR = os.path.join(basedir, 'static')
+SRC_DIR = os.path.join(STATIC_DIR, 'src')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+BIN_DIR = os.path.join(basedir, 'node_modules', '.bin')
+FONT_DIR = os.path.join(basedir, 'node_modules', '@fontsource', 'outfit', 'files')
+FONT_WEIGHTS = (300, 400, 500, 600, 700)
+
+def run(tool, *args):
+    subprocess.run([os.path.join(BIN_DIR, tool), *args], cwd=basedir, check=True)
+
+def fingerprint(path):
+    # Rename path to <name>.<hash><ext> and return the new path
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    root, ext = os.path.splitext(path)
+    hashed = f"{root}.{digest}{ext}"
+    os.replace(path, hashed)
+    return hashed
+
+def static_path(path):
+    return os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+
+def main():
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    os.makedirs(os.path.join(DIST_DIR, 'fonts'))
+    manifest = {}
+
+    # Fonts first, so the CSS can be pointed at their hashed names
+    for weight in FONT_WEIGHTS:
+        name = f"outfit-latin-{weight}-normal.woff2"
+        dest = os.path.join(DIST_DIR, 'fonts', name)
+        shutil.copyfile(os.path.join(FONT_DIR, name), dest)
+        manifest[static_path(dest)] = static_path(fingerprint(dest))
+
+    css = os.path.join(DIST_DIR, 'app.css')
+    run('tailwindcss', '-c', 'tailwind.config.js', '-i', os.path.join(SRC_DIR, 'app.css'), '-o', css, '--minify')
+    with open(css) as f:
+        content = f.read()
+    for logical, hashed in manifest.items():
+        # app.css references fonts relative to dist/
+        content = content.replace(logical[len('dist/'):], hashed[len('dist/'):])
+    with open(css, 'w') as f:
+        f.write(content)
+    manifest[static_path(css)] = static_path(fingerprint(css))
+
+    js = os.path.join(DIST_DIR, 'app.js')
+    run('esbuild', os.path.join(SRC_DIR, 'app.js'), '--bundle', '--minify', f"--outfile={js}")
+    manifest[static_path(js)] = static_path(fingerprint(js))
+
+    with open(os.path.join(DIST_DIR, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    for logical, hashed in sorted(manifest.items()):
+        print(f"{logical} -> {hashed}")
+
+if __name__ == '__main__':
+    main()
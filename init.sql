@@ -5,10 +5,22 @@ CREATE TABLE IF NOT EXISTS products (
     price FLOAT NOT NULL,
     category VARCHAR(50) NOT NULL,
     image_base64 TEXT,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS product_changes (
+    seq INT AUTO_INCREMENT PRIMARY KEY,
+    product_id INT NOT NULL,
+    op VARCHAR(10) NOT NULL,
+    changed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_product_changes_product_id (product_id)
 );
 
 INSERT INTO products (name, description, price, category, image_base64) VALUES
 ('Nova Headphones', 'Premium wireless noise-cancelling headphones for an immersive experience.', 199.99, 'Electronics', NULL),
 ('Smart Watch Pro', 'Tracks your health, notifications, and fitness goals with style.', 249.50, 'Wearables', NULL),
 ('Minimalist Lamp', 'Sleek wooden base lamp for a modern and warm workspace ambiance.', 45.00, 'Home Decor', NULL);
+
+INSERT INTO product_changes (product_id, op)
+SELECT id, 'create' FROM products ORDER BY id;
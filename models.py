@@ -15,6 +15,7 @@ class UserModel(db.Model):
 
 class ProductModel(db.Model):
     __tablename__ = 'products'
+    __table_args__ = {'sqlite_autoincrement': True} # Never reuse an id that the change log refers to
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -22,6 +23,16 @@ class ProductModel(db.Model):
     category = db.Column(db.String(50), nullable=False)
     image_base64 = db.Column(db.Text, nullable=True) # Storing image as Base64 string
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ProductChangeModel(db.Model):
+    # Append-only catalog change log; seq is the cursor for /api/items/changes
+    __tablename__ = 'product_changes'
+    __table_args__ = {'sqlite_autoincrement': True} # Never reuse a seq
+    seq = db.Column(db.Integer, primary_key=True)
+    product_id = db.Column(db.Integer, nullable=False, index=True) # No FK: tombstones outlive the product
+    op = db.Column(db.String(10), nullable=False) # 'create', 'update' or 'delete'
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 # --- Pydantic Schemas (for Validation) ---
 class UserBase(BaseModel):
@@ -0,0 +1,101 @@
+// Common JS logic, bundled once by build_assets.py and cached across pages.
+// Handlers used from inline onclick attributes are exposed on window.
+
+window.addToCart = async function (productId) {
+    try {
+        const resp = await fetch('/api/cart/add', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({product_id: productId})
+        });
+        if(resp.ok) {
+            location.reload();
+        } else {
+            const err = await resp.json();
+            alert(err.error || 'Failed to add to cart');
+        }
+    } catch (e) {
+        console.error(e);
+        alert('An error occurred while adding to cart.');
+    }
+};
+
+window.removeFromCart = async function (productId) {
+    const resp = await fetch('/api/cart/remove', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({product_id: productId})
+    });
+    if(resp.ok) {
+        location.reload();
+    }
+};
+
+// Page forms: only the form present on the current page gets wired up.
+function onSubmit(formId, handler) {
+    const form = document.getElementById(formId);
+    if (!form) return;
+    form.addEventListener('submit', async (e) => {
+        e.preventDefault();
+        await handler();
+    });
+}
+
+onSubmit('loginForm', async () => {
+    const username = document.getElementById('username').value;
+    const password = document.getElementById('password').value;
+
+    const resp = await fetch('/api/login', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({username, password})
+    });
+
+    const data = await resp.json();
+    if(resp.ok) {
+        // Save token to localStorage
+        localStorage.setItem('access_token', data.access_token);
+        localStorage.setItem('username', username);
+        window.location.href = '/';
+    } else {
+        alert(data.error || 'Login failed');
+    }
+});
+
+onSubmit('registerForm', async () => {
+    const username = document.getElementById('username').value;
+    const email = document.getElementById('email').value;
+    const password = document.getElementById('password').value;
+
+    const resp = await fetch('/api/register', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({username, email, password})
+    });
+
+    const data = await resp.json();
+    if(resp.ok) {
+        alert('Registration successful! Please login.');
+        window.location.href = '/login';
+    } else {
+        alert(data.error || 'Registration failed');
+    }
+});
+
+onSubmit('checkoutForm', async () => {
+    const address = document.getElementById('address').value;
+    const payment_method = document.querySelector('input[name="payment_method"]:checked').value;
+
+    const resp = await fetch('/api/checkout', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({address, payment_method})
+    });
+
+    const data = await resp.json();
+    if(resp.ok) {
+        window.location.href = `/results?order_id=${data.order.order_id}&status=success`;
+    } else {
+        alert(data.error);
+    }
+});
@@ -0,0 +1,18 @@
+/** @type {import('tailwindcss').Config} */
+module.exports = {
+  // Only classes referenced from these files end up in the compiled bundle.
+  content: ['./templates/**/*.html', './static/src/**/*.js'],
+  theme: {
+    extend: {
+      colors: {
+        primary: '#9855FF',
+        secondary: '#D3CBDE',
+        dark: '#1A1A1A',
+      },
+      fontFamily: {
+        sans: ['Outfit', 'sans-serif'],
+      },
+    },
+  },
+  plugins: [],
+}
@@ -3,7 +3,7 @@ import json
 import base64
 from io import BytesIO
 from app import app, db
-from models import ProductModel, UserModel
+from models import ProductModel, ProductChangeModel, UserModel
 
 @pytest.fixture
 def client():
@@ -145,3 +145,91 @@ def test_checkout(client):
     data = resp.get_json()
     assert data['order']['total'] == 100.0
     assert data['order']['status'] == "Paid"
+
+def latest_change_seq(client):
+    # Page to the head of the feed; the database may already hold earlier changes
+    data = {"last_seq": 0, "has_more": True}
+    while data['has_more']:
+        data = client.get(f"/api/items/changes?since={data['last_seq']}&limit=1000").get_json()
+    return data['last_seq']
+
+def test_item_changes_feed(client, auth_header):
+    cursor = latest_change_seq(client)
+    item = {"name": "Feed Item", "description": "Desc", "price": 10.0, "category": "Test"}
+    p_id = client.post('/api/items', headers=auth_header, json=item).get_json()['id']
+    client.put(f'/api/items/{p_id}', headers=auth_header, json={**item, "price": 12.0})
+    other_id = client.post('/api/items', headers=auth_header, json={**item, "name": "Other Item"}).get_json()['id']
+    client.delete(f'/api/items/{p_id}', headers=auth_header)
+
+    resp = client.get(f'/api/items/changes?since={cursor}')
+    assert resp.status_code == 200
+    data = resp.get_json()
+    changes = data['changes']
+    assert [(c['op'], c['product_id']) for c in changes] == [
+        ('create', p_id), ('update', p_id), ('create', other_id), ('delete', p_id)
+    ]
+    assert [c['seq'] for c in changes] == list(range(cursor + 1, cursor + 5))
+    assert data['has_more'] is False
+    assert data['last_seq'] == changes[-1]['seq']
+    # Deleted products are tombstones; live ones carry their current state
+    assert changes[0]['item'] is None
+    assert changes[3]['item'] is None
+    assert changes[2]['item']['name'] == "Other Item"
+
+    # Nothing new since the last seq
+    resp = client.get(f"/api/items/changes?since={data['last_seq']}")
+    assert resp.get_json() == {"changes": [], "last_seq": data['last_seq'], "has_more": False}
+
+def test_item_changes_batching(client, auth_header):
+    cursor = latest_change_seq(client)
+    for i in range(3):
+        client.post('/api/items', headers=auth_header, json={
+            "name": f"Item {i}", "description": "Desc", "price": 10.0, "category": "Test"
+        })
+
+    first = client.get(f'/api/items/changes?since={cursor}&limit=2').get_json()
+    assert [c['item']['name'] for c in first['changes']] == ["Item 0", "Item 1"]
+    assert first['has_more'] is True
+
+    second = client.get(f"/api/items/changes?since={first['last_seq']}&limit=2").get_json()
+    assert [c['item']['name'] for c in second['changes']] == ["Item 2"]
+    assert second['has_more'] is False
+
+def test_item_changes_ignore_reused_ids(client, auth_header):
+    cursor = latest_change_seq(client)
+    item = {"name": "Old Item", "description": "Desc", "price": 10.0, "category": "Test"}
+    p_id = client.post('/api/items', headers=auth_header, json=item).get_json()['id']
+    client.delete(f'/api/items/{p_id}', headers=auth_header)
+
+    # Simulate a database without AUTOINCREMENT handing the id out again
+    with app.app_context():
+        db.session.add(ProductModel(id=p_id, name="New Item", description="Desc", price=5.0, category="Test"))
+        db.session.add(ProductChangeModel(product_id=p_id, op='create'))
+        db.session.commit()
+
+    changes = client.get(f'/api/items/changes?since={cursor}').get_json()['changes']
+    assert [(c['op'], c['item'] and c['item']['name']) for c in changes] == [
+        ('create', None), ('delete', None), ('create', "New Item")
+    ]
+
+def test_item_changes_stream(client, auth_header, monkeypatch):
+    cursor = latest_change_seq(client)
+    client.post('/api/items', headers=auth_header, json={
+        "name": "Streamed Item", "description": "Desc", "price": 10.0, "category": "Test"
+    })
+
+    # A zero lifetime makes the stream send one batch and close
+    monkeypatch.setitem(app.config, 'CHANGES_STREAM_MAX_SECONDS', 0)
+    resp = client.get(f'/api/items/changes/stream?since={cursor}')
+    assert resp.status_code == 200
+    assert resp.mimetype == 'text/event-stream'
+    body = resp.get_data(as_text=True)
+    assert body.startswith("retry: ")
+    events = [e for e in body.split("\n\n") if e.startswith("id: ")]
+    assert len(events) == 1
+    assert events[0].startswith(f"id: {cursor + 1}\nevent: change\ndata: ")
+    assert json.loads(events[0].split("data: ", 1)[1])['item']['name'] == "Streamed Item"
+
+    # Reconnecting with Last-Event-ID picks up after the last delivered change
+    resp = client.get('/api/items/changes/stream', headers={'Last-Event-ID': str(cursor + 1)})
+    assert "id: " not in resp.get_data(as_text=True)
@@ -74,7 +74,7 @@ def test_login_page_renders(client):
     """Test that the login page contains the login form."""
     resp = client.get('/login')
     assert resp.status_code == 200
-    assert b"Login" in resp.data
+    assert b'id="loginForm"' in resp.data
     assert b"username" in resp.data.lower()
     assert b"password" in resp.data.lower()
 
@@ -94,3 +94,49 @@ def test_flash_message_on_upload(client):
     assert resp.status_code == 200
     assert b"Product uploaded successfully!" in resp.data
     assert b"New Upload" in resp.data
+
+def test_layout_uses_fingerprinted_assets(client, monkeypatch):
+    """Test that pages link the hashed build output instead of CDNs and inline scripts."""
+    monkeypatch.setitem(app.extensions, 'asset_manifest', {
+        'dist/app.css': 'dist/app.0123456789ab.css',
+        'dist/app.js': 'dist/app.ba9876543210.js'
+    })
+
+    resp = client.get('/login')
+    assert resp.status_code == 200
+    assert b"/static/dist/app.0123456789ab.css" in resp.data
+    assert b"/static/dist/app.ba9876543210.js" in resp.data
+    assert b"cdn.tailwindcss.com" not in resp.data
+    assert b"fonts.googleapis.com" not in resp.data
+    assert b"<script>" not in resp.data
+
+def test_layout_falls_back_to_source_assets(client, monkeypatch):
+    """Test that an unbuilt checkout still links working CSS and JS."""
+    monkeypatch.setitem(app.extensions, 'asset_manifest', {})
+
+    resp = client.get('/login')
+    assert resp.status_code == 200
+    assert b"/static/src/app.css" in resp.data
+    assert b"/static/src/app.js" in resp.data
+    assert b"/static/dist/" not in resp.data
+
+    resp = client.get('/static/src/app.js')
+    assert resp.status_code == 200
+    assert b"loginForm" in resp.data
+    resp.close()
+
+def test_fingerprinted_assets_cached_immutably(client, monkeypatch, tmp_path):
+    """Test that hashed assets are served with a year-long immutable Cache-Control."""
+    (tmp_path / 'dist').mkdir()
+    (tmp_path / 'dist' / 'app.0123456789ab.css').write_text('body{}')
+    (tmp_path / 'plain.css').write_text('body{}')
+    monkeypatch.setattr(app, 'static_folder', str(tmp_path))
+    monkeypatch.setitem(app.extensions, 'asset_manifest', {'dist/app.css': 'dist/app.0123456789ab.css'})
+
+    resp = client.get('/static/dist/app.0123456789ab.css')
+    assert resp.status_code == 200
+    assert resp.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+    resp = client.get('/static/plain.css')
+    assert resp.status_code == 200
+    assert 'immutable' not in resp.headers.get('Cache-Control', '')